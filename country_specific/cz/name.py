@@ -1,6 +1,8 @@
 from shared.core.registry import plugin
 from shared.services.name import Name
 
+_NAME = "České Jméno"
+
 
 @plugin(Name)
 class CzechName(Name):
@@ -9,4 +11,4 @@ class CzechName(Name):
     @staticmethod
     def get() -> str:
         """Get the name of the person in Czech."""
-        return "České Jméno"
+        return _NAME
@@ -8,6 +8,9 @@ class HungarianAddress(Address):
     Hungarian address implementation.
     """
 
+    # All attributes are declared by Address.__slots__
+    __slots__ = ()
+
     def __init__(self, street: str, city: str, postal_code: str):
         """Initialize the Hungarian address service."""
         super().__init__(street, city, postal_code)
@@ -15,4 +18,4 @@ class HungarianAddress(Address):
         self.separator = ": "
 
     def _validate_postal_code(self, postal_code: str) -> bool:
-        return len(postal_code.strip()) == 4 and postal_code.isdigit()
+        return len(postal_code) == 4 and postal_code.isdigit()
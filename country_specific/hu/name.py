@@ -1,6 +1,8 @@
 from shared.core.registry import plugin
 from shared.services.name import Name
 
+_NAME = "Magyar Név"
+
 
 @plugin(Name)
 class HungarianName(Name):
@@ -9,4 +11,4 @@ class HungarianName(Name):
     @staticmethod
     def get() -> str:
         """Get the name of the person in Hungarian."""
-        return "Magyar Név"
+        return _NAME
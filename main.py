@@ -6,22 +6,37 @@ import logging
 import sys
 from typing import Optional
 
-from shared.core.country_loader import (
-    CountryPluginLoader,
-    load_country_specific_plugins,
-)
+from shared.core.country_loader import get_loader, load_country_specific_plugins
 from shared.core.registry import PluginRegistry
 from shared.services.address import Address
 from shared.services.greeting import Greet
 
+# Program output; written to stdout regardless of the diagnostic log level
+output = logging.getLogger("plugin2.output")
+
 
 def setup_logging():
-    """Configure logging for the application."""
+    """
+    Configure logging for the application.
+
+    Diagnostics go to stderr with their logger name and level. Program
+    output is logged through `output`, which has its own level and stdout
+    handler, so raising the root log level doesn't silence it. Handlers
+    from a previous call are replaced, so main() can run more than once in
+    a process.
+    """
     logging.basicConfig(
         level=logging.INFO,
         format="%(name)s - %(levelname)s - %(message)s",
+        force=True,
     )
 
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    output.handlers[:] = [handler]
+    output.setLevel(logging.INFO)
+    output.propagate = False
+
 
 def main():
     """Main application function."""
@@ -29,32 +44,31 @@ def main():
     logger = logging.getLogger(__name__)
 
     # Show available countries
-    loader = CountryPluginLoader()
+    loader = get_loader()
     available_countries = loader.get_available_countries()
-    logger.info(f"Available countries: {available_countries}")
+    logger.info("Available countries: %s", available_countries)
 
     # Get country code from command line argument if provided
     country_code: Optional[str] = None
     if len(sys.argv) > 1:
         country_code = sys.argv[1].lower()
-        logger.info(f"Country code from command line: {country_code}")
+        logger.info("Country code from command line: %s", country_code)
 
     # Load country-specific plugins
     if not load_country_specific_plugins(country_code):
         logger.error("Failed to load country-specific plugins")
         sys.exit(1)
 
-    # # Show what was loaded
-    # loaded_countries = loader.get_loaded_countries()
-    # logger.info(f"Loaded countries: {loaded_countries}")
+    # Show what was loaded
+    loaded_countries = loader.get_loaded_countries()
+    logger.info("Loaded countries: %s", loaded_countries)
 
     # Get registry info
-    registry = PluginRegistry()
-    pluggable_classes = registry.get_pluggable_classes()
-    logger.info(f"Pluggable classes: {pluggable_classes}")
+    pluggable_classes = PluginRegistry.get_pluggable_classes()
+    logger.info("Pluggable classes: %s", pluggable_classes)
 
-    print("\nGreetings Testing:")
-    print("-" * 20)
+    output.info("\nGreetings Testing:")
+    output.info("-" * 20)
     # Test the greeting service
     logger.info("Testing greeting service...")
 
@@ -64,7 +78,6 @@ def main():
 
         # Get info about the implementation
         info = greeter.get_greeting_info()
-        logger.info(f"Using greeting implementation: {info}")
 
         # Test greetings
         hello_msg = greeter.say_hello("World")
@@ -72,13 +85,14 @@ def main():
         goodbye_msg = greeter.say_goodbye("World")
         message_end = Greet.message_end()
 
-
-        print(f"Hello: {hello_msg}")
-        print(f"Hello Version 2: {hello_msg2}")
-        print(f"Goodbye: {goodbye_msg}")
-        print(f"Implementation: {info['class']} ({info.get('country', 'unknown')})")
-        print(f"Message end: '{message_end}'")
-        print()
+        output.info("Hello: %s", hello_msg)
+        output.info("Hello Version 2: %s", hello_msg2)
+        output.info("Goodbye: %s", goodbye_msg)
+        output.info(
+            "Implementation: %s (%s)", info["class"], info.get("country", "unknown")
+        )
+        output.info("Message end: '%s'", message_end)
+        output.info("")
 
         # For Hungarian addresses, use 4-digit postal codes
         # For default (US) addresses, any non-empty string is valid
@@ -91,65 +105,78 @@ def main():
             invalid_postal_code = ""  # Invalid (empty string)
             alternative_invalid = "   "  # Invalid (only spaces)
 
-        print("\nAddress Testing:")
-        print("-" * 20)
+        output.info("\nAddress Testing:")
+        output.info("-" * 20)
 
         # Test with valid postal code
         try:
             address_valid = Address("123 Main Street", "Budapest", valid_postal_code)
             address_info = address_valid.get_address_info()
-            logger.info(f"Using address implementation: {address_info}")
 
             formatted_address = address_valid.format_address()
-            print(f"✓ Valid address: {formatted_address}")
-            print(
-                f"  Implementation: {address_info['class']} ({address_info.get('country', 'unknown')})"
+            output.info("✓ Valid address: %s", formatted_address)
+            output.info(
+                "  Implementation: %s (%s)",
+                address_info["class"],
+                address_info.get("country", "unknown"),
             )
-            print(f"  Separator: '{address_info['separator']}'")
+            output.info("  Separator: '%s'", address_info["separator"])
         except Exception as e:
-            logger.error(f"Error with valid postal code '{valid_postal_code}': {e}")
-            print(f"✗ Error with valid postal code: {e}")
+            logger.error("Error with valid postal code '%s': %s", valid_postal_code, e)
+            output.info("✗ Error with valid postal code: %s", e)
 
         # Test with invalid postal code
         try:
             address_invalid = Address("456 Oak Avenue", "Vienna", invalid_postal_code)
             formatted_address_invalid = address_invalid.format_address()
-            print(
-                f"✗ Invalid address (should not reach here): {formatted_address_invalid}"
+            output.info(
+                "✗ Invalid address (should not reach here): %s",
+                formatted_address_invalid,
             )
         except ValueError as e:
             logger.info(
-                f"Correctly caught invalid postal code '{invalid_postal_code}': {e}"
+                "Correctly caught invalid postal code '%s': %s", invalid_postal_code, e
+            )
+            output.info(
+                "✓ Invalid postal code test passed: '%s' -> %s", invalid_postal_code, e
             )
-            print(f"✓ Invalid postal code test passed: '{invalid_postal_code}' -> {e}")
         except Exception as e:
             logger.error(
-                f"Unexpected error with invalid postal code '{invalid_postal_code}': {e}"
+                "Unexpected error with invalid postal code '%s': %s",
+                invalid_postal_code,
+                e,
             )
-            print(f"✗ Unexpected error: {e}")
+            output.info("✗ Unexpected error: %s", e)
 
         # Test with alternative invalid postal code (for completeness)
         try:
             address_invalid2 = Address("789 Pine Street", "Prague", alternative_invalid)
             formatted_address_invalid2 = address_invalid2.format_address()
-            print(
-                f"✗ Alternative invalid address (should not reach here): {formatted_address_invalid2}"
+            output.info(
+                "✗ Alternative invalid address (should not reach here): %s",
+                formatted_address_invalid2,
             )
         except ValueError as e:
             logger.info(
-                f"Correctly caught alternative invalid postal code '{alternative_invalid}': {e}"
+                "Correctly caught alternative invalid postal code '%s': %s",
+                alternative_invalid,
+                e,
             )
-            print(
-                f"✓ Alternative invalid postal code test passed: '{alternative_invalid}' -> {e}"
+            output.info(
+                "✓ Alternative invalid postal code test passed: '%s' -> %s",
+                alternative_invalid,
+                e,
             )
         except Exception as e:
             logger.error(
-                f"Unexpected error with alternative invalid postal code '{alternative_invalid}': {e}"
+                "Unexpected error with alternative invalid postal code '%s': %s",
+                alternative_invalid,
+                e,
             )
-            print(f"✗ Unexpected error with alternative invalid: {e}")
+            output.info("✗ Unexpected error with alternative invalid: %s", e)
 
     except Exception as e:
-        logger.error(f"Error during testing: {e}")
+        logger.error("Error during testing: %s", e)
         sys.exit(1)
 
 
@@ -2,46 +2,126 @@
 Country-specific plugin loader that selectively loads plugins based on configuration.
 """
 
+import functools
 import importlib
+import importlib.metadata
+import importlib.util
 import logging
 import os
-from typing import Dict, List, Optional
+import pkgutil
+import sys
+import types
+from typing import Any, ClassVar, Dict, Iterable, Mapping, Optional, Tuple
+
+from shared.core.registry import PluginRegistry
 
 logger = logging.getLogger(__name__)
 
 
-class CountryPluginLoader:
+@functools.lru_cache(maxsize=1)
+def _all_entry_points() -> Any:
+    """Scan the installed distributions for entry points once per process."""
+    # entry_points(group=...) also scans every distribution, so a scan per
+    # group would repeat the work for the country and service groups
+    return importlib.metadata.entry_points()
+
+
+def _select_entry_points(group: str) -> Iterable[importlib.metadata.EntryPoint]:
     """
-    Loads plugins only for a specified country to avoid registry conflicts.
+    Select the entry points of a group from the cached scan.
+
+    Args:
+        group: The entry point group name
+
+    Returns:
+        The entry points registered for the group
     """
+    return _all_entry_points().select(group=group)
 
-    def __init__(self):
-        self._loaded_countries: List[str] = []
-        self._available_countries = self._discover_available_countries()
 
-    def _discover_available_countries(self) -> Dict[str, str]:
-        """
-        Discover available countries from entry points.
+@functools.lru_cache(maxsize=1)
+def _discover() -> Mapping[str, str]:
+    """
+    Discover available countries from entry points.
 
-        Returns:
-            Dictionary mapping country codes to module paths
-        """
-        import importlib.metadata
+    The result is cached for the lifetime of the process so that every
+    CountryPluginLoader shares a single entry point scan.
 
-        # Get entry points for our plugin group
-        entry_points = importlib.metadata.entry_points(group="plugin2.countries")
-        countries: Dict[str, str] = {}
+    Returns:
+        Read-only mapping of country codes to module paths
+    """
+    # Get entry points for our plugin group
+    entry_points = _select_entry_points("plugin2.countries")
+    countries: Dict[str, str] = {}
+
+    for entry_point in entry_points:
+        countries[entry_point.name] = entry_point.value
+        logger.debug(
+            "Discovered country plugin: %s -> %s", entry_point.name, entry_point.value
+        )
+
+    return types.MappingProxyType(countries)
 
-        for entry_point in entry_points:
-            countries[entry_point.name] = entry_point.value
-            logger.debug(
-                f"Discovered country plugin: {entry_point.name} -> {entry_point.value}"
-            )
 
-        return countries
+@functools.lru_cache(maxsize=None)
+def _discover_services(country_code: str) -> Dict[str, str]:
+    """
+    Discover the per-service plugin modules of a country from entry points.
+
+    Each country may declare a ``plugin2.countries.<country_code>`` group
+    mapping pluggable class names to the module implementing their plugin.
+
+    Args:
+        country_code: The country code to discover services for
+
+    Returns:
+        Dictionary mapping pluggable class names to module paths
+    """
+    entry_points = _select_entry_points(f"plugin2.countries.{country_code}")
+    services: Dict[str, str] = {}
+
+    for entry_point in entry_points:
+        services[entry_point.name] = entry_point.value
+        logger.debug(
+            "Discovered %s service plugin: %s -> %s",
+            country_code,
+            entry_point.name,
+            entry_point.value,
+        )
+
+    return services
+
 
+def reset_discovery_cache():
+    """Clear the cached entry point discovery (for testing)."""
+    _all_entry_points.cache_clear()
+    _discover.cache_clear()
+    _discover_services.cache_clear()
 
-    def _load_all_modules_in_package(self, package_path: str) -> List[str]:
+
+class CountryPluginLoader:
+    """
+    Loads plugins only for a specified country to avoid registry conflicts.
+
+    Use get_instance() to obtain the shared loader so that every caller
+    sees the same set of loaded countries.
+    """
+
+    _instance: ClassVar[Optional["CountryPluginLoader"]] = None
+
+    def __init__(self):
+        self._loaded_countries: Tuple[str, ...] = ()
+        self._available_countries = _discover()
+        self._available_country_codes = tuple(self._available_countries)
+
+    @classmethod
+    def get_instance(cls) -> "CountryPluginLoader":
+        """Get the shared loader instance, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _load_all_modules_in_package(self, package_path: str) -> int:
         """
         Discover and import all Python modules within a package.
 
@@ -49,43 +129,92 @@ class CountryPluginLoader:
             package_path: The package path (e.g., 'country_specific.cz')
 
         Returns:
-            List of imported module names
+            Number of imported modules
         """
-        imported_modules: List[str] = []
+        imported_modules = []
 
         try:
             # Import the package first
             package = importlib.import_module(package_path)
-            logger.debug(f"Imported package: {package_path}")
+            logger.debug("Imported package: %s", package_path)
 
-            # Get the package's file path
+            # Discover all submodules through the package's importers
             if hasattr(package, "__path__"):
-                package_dir = package.__path__[0]
-                logger.debug(f"Package directory: {package_dir}")
-
-                # Discover all .py files in the package directory
-                for item in os.listdir(package_dir):
-                    if item.endswith(".py") and item != "__init__.py":
-                        module_name = item[:-3]  # Remove .py extension
-                        full_module_path = f"{package_path}.{module_name}"
-
-                        try:
-                            importlib.import_module(full_module_path)
-                            imported_modules.append(full_module_path)
-                            logger.debug(f"Successfully imported: {full_module_path}")
-                        except ImportError as e:
-                            logger.warning(f"Failed to import {full_module_path}: {e}")
+                for _, full_module_path, ispkg in pkgutil.iter_modules(
+                    package.__path__, package_path + "."
+                ):
+                    if ispkg:
+                        continue
+
+                    try:
+                        importlib.import_module(full_module_path)
+                        # Covers modules imported before, whose @plugin doesn't run again
+                        PluginRegistry.register_module_plugins(full_module_path)
+                        imported_modules.append(full_module_path)
+                        logger.debug("Successfully imported: %s", full_module_path)
+                    except ImportError as e:
+                        logger.warning("Failed to import %s: %s", full_module_path, e)
+                if imported_modules:
+                    package._plugin_modules = tuple(imported_modules)
             else:
-                logger.warning(f"Package {package_path} has no __path__ attribute")
+                logger.warning("Package %s has no __path__ attribute", package_path)
 
         except ImportError as e:
-            logger.error(f"Failed to import package {package_path}: {e}")
+            logger.error("Failed to import package %s: %s", package_path, e)
 
-        return imported_modules
+        return len(imported_modules)
 
-    def get_available_countries(self) -> List[str]:
-        """Get list of available country codes."""
-        return list(self._available_countries.keys())
+    def _register_lazy_plugins(
+        self, country_code: str, service_modules: Dict[str, str]
+    ) -> bool:
+        """
+        Register the plugin modules of a country without importing them.
+
+        Each module is imported by the registry the first time its
+        pluggable class is used.
+
+        Args:
+            country_code: The country code the modules belong to
+            service_modules: Mapping of pluggable class names to module paths
+
+        Returns:
+            True once all modules have been registered, False if a module
+            path cannot be resolved
+        """
+        logger.info("Registering lazy plugins for country: %s", country_code)
+
+        # Resolve the paths now, so a broken entry point fails the country
+        # load instead of the first use of the pluggable class
+        for class_name, module_path in service_modules.items():
+            try:
+                spec = importlib.util.find_spec(module_path)
+            except (ImportError, ValueError):
+                spec = None
+            if spec is None:
+                logger.error(
+                    "Plugin module %s for %s not found in country %s",
+                    module_path,
+                    class_name,
+                    country_code,
+                )
+                return False
+
+        for class_name, module_path in service_modules.items():
+            PluginRegistry.register_lazy_plugin(class_name, module_path)
+
+        self._loaded_countries += (country_code,)
+        logger.info(
+            "Successfully registered %s plugins for %s services: %s",
+            country_code,
+            len(service_modules),
+            list(service_modules),
+        )
+        return True
+
+    @classmethod
+    def get_available_countries(cls) -> Tuple[str, ...]:
+        """Get the available country codes."""
+        return cls.get_instance()._available_country_codes
 
     def load_country_plugins(self, country_code: str) -> bool:
         """
@@ -98,52 +227,86 @@ class CountryPluginLoader:
             True if plugins were loaded successfully, False otherwise
         """
         if country_code in self._loaded_countries:
-            logger.info(f"Country {country_code} plugins already loaded")
+            logger.info("Country %s plugins already loaded", country_code)
             return True
 
         if country_code not in self._available_countries:
             logger.error(
-                f"Country {country_code} not available. Available: {list(self._available_countries.keys())}"
+                "Country %s not available. Available: %s",
+                country_code,
+                self._available_country_codes,
             )
             return False
 
         module_path = self._available_countries[country_code]
 
+        # Prefer per-service modules that are imported on first use
+        service_modules = _discover_services(country_code)
+        if service_modules:
+            return self._register_lazy_plugins(country_code, service_modules)
+
+        # The package was already fully imported, e.g. before the loaded
+        # countries were cleared; register its plugins again without rescanning
+        package = sys.modules.get(module_path)
+        plugin_modules = getattr(package, "_plugin_modules", ())
+        if plugin_modules and sum(
+            PluginRegistry.register_module_plugins(module) for module in plugin_modules
+        ):
+            logger.info("Country %s plugins already imported", country_code)
+            self._loaded_countries += (country_code,)
+            return True
+
         try:
-            logger.info(f"Loading plugins for country: {country_code}")
-            logger.debug(f"Importing package: {module_path}")
+            logger.info("Loading plugins for country: %s", country_code)
+            logger.debug("Importing package: %s", module_path)
 
             # Import all modules in the country package
-            imported_modules = self._load_all_modules_in_package(module_path)
+            imported_count = self._load_all_modules_in_package(module_path)
 
-            if imported_modules:
-                self._loaded_countries.append(country_code)
+            if imported_count > 0:
+                self._loaded_countries += (country_code,)
                 logger.info(
-                    f"Successfully loaded {country_code} plugins from {len(imported_modules)} modules: {imported_modules}"
+                    "Successfully loaded %s plugins from %s modules",
+                    country_code,
+                    imported_count,
                 )
                 return True
             else:
-                logger.warning(f"No modules found in package {module_path}")
+                logger.warning("No modules found in package %s", module_path)
                 return False
 
         except ImportError as e:
             logger.error(
-                f"Failed to load {country_code} plugins from {module_path}: {e}"
+                "Failed to load %s plugins from %s: %s", country_code, module_path, e
             )
             return False
 
-    def get_loaded_countries(self) -> List[str]:
-        """Get list of currently loaded country codes."""
-        return self._loaded_countries.copy()
+    def get_loaded_countries(self) -> Tuple[str, ...]:
+        """Get the currently loaded country codes."""
+        return self._loaded_countries
 
     def clear_loaded_countries(self):
         """Clear the list of loaded countries (for testing)."""
-        self._loaded_countries.clear()
+        self._loaded_countries = ()
 
 
-def get_country_from_config() -> Optional[str]:
+def get_loader() -> CountryPluginLoader:
     """
-    Get the country code from environment variable or config file.
+    Get the loader shared by every caller in the process.
+
+    Returns:
+        The shared CountryPluginLoader instance
+    """
+    return CountryPluginLoader.get_instance()
+
+
+# Country code of the last successful get_country_from_config() read
+_config_country: Optional[str] = None
+
+
+def _read_country_config() -> Optional[str]:
+    """
+    Read the country code from environment variable or config file.
 
     Returns:
         Country code if found, None otherwise
@@ -151,25 +314,49 @@ def get_country_from_config() -> Optional[str]:
     # First check environment variable
     country = os.environ.get("PLUGIN2_COUNTRY")
     if country:
-        logger.info(f"Country loaded from environment: {country}")
+        logger.info("Country loaded from environment: %s", country)
         return country.lower()
 
     # Check for config file
     config_file = "country_config.txt"
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, "r") as f:
-                country = f.read().strip()
-                if country:
-                    logger.info(f"Country loaded from {config_file}: {country}")
-                    return country.lower()
-        except Exception as e:
-            logger.warning(f"Failed to read {config_file}: {e}")
+    try:
+        with open(config_file, "r") as f:
+            country = f.read().strip()
+            if country:
+                logger.info("Country loaded from %s: %s", config_file, country)
+                return country.lower()
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Failed to read %s: %s", config_file, e)
 
     logger.warning("No country configuration found")
     return None
 
 
+def get_country_from_config() -> Optional[str]:
+    """
+    Get the country code from environment variable or config file.
+
+    A successful read is cached for the lifetime of the process; call
+    reset_country_config_cache() to re-read the configuration. A missing or
+    unreadable configuration is not cached, so it may be fixed later.
+
+    Returns:
+        Country code if found, None otherwise
+    """
+    global _config_country
+    if _config_country is None:
+        _config_country = _read_country_config()
+    return _config_country
+
+
+def reset_country_config_cache():
+    """Clear the cached country configuration (for testing)."""
+    global _config_country
+    _config_country = None
+
+
 def load_country_specific_plugins(country_code: Optional[str] = None) -> bool:
     """
     Load plugins for a specific country only.
@@ -187,5 +374,4 @@ def load_country_specific_plugins(country_code: Optional[str] = None) -> bool:
         logger.error("No country code specified and none found in configuration")
         return False
 
-    loader = CountryPluginLoader()
-    return loader.load_country_plugins(country_code)
+    return get_loader().load_country_plugins(country_code)
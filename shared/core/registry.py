@@ -6,8 +6,11 @@ This module provides the core functionality for:
 - Decorators for marking classes as pluggable and plugins
 """
 
+import functools
+import importlib
 import logging
-from typing import Any, Callable, Dict, Optional, TypeVar
+import weakref
+from typing import Any, Callable, ClassVar, Dict, Optional, Set, TypeVar
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -17,43 +20,29 @@ def override_required(func: Callable[..., Any]) -> Callable[..., Any]:
     """
     Decorator to mark a method as required for plugin implementations.
 
-    This decorator replaces abstractmethod and raises a PluginRequiredMethodError
-    if a plugin doesn't implement the required method.
+    This decorator replaces abstractmethod. Subclasses are checked once when
+    they are created (see OverrideRequiredMixin), so calls to the overriding
+    method have no extra indirection. Calling the marked method itself, e.g.
+    on a pluggable class without a plugin, always raises.
 
     Args:
         func: The method to mark as required
 
     Returns:
-        The decorated method
+        The marked method
 
     Raises:
-        PluginRequiredMethodError: When called on a method that hasn't been overridden
+        PluginRequiredMethodError: When the marked base method is called
     """
 
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        # Get the class that defined this method
-        calling_class = args[0].__class__
-        method_name = func.__name__
-
-        # Check if this method has been overridden in the calling class
-        # by comparing the actual implementation
-        current_method = getattr(calling_class, method_name)
-
-        # If current_method is the same as our wrapper, it means it hasn't been overridden
-        if hasattr(current_method, "__override_required__"):
-            raise PluginRequiredMethodError(
-                f"Plugin '{calling_class.__name__}' must implement the required method '{method_name}'. "
-                f"This method is marked as @override_required and cannot use the base implementation."
-            )
-
-        # If overridden, call the actual implementation
-        return current_method(*args, **kwargs) # type: ignore[return-value]
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        raise PluginRequiredMethodError(
+            f"Plugin '{type(self).__name__}' must implement the required method '{func.__name__}'. "
+            f"This method is marked as @override_required and cannot use the base implementation."
+        )
 
-    # Mark the function as override required for introspection
     setattr(wrapper, "__override_required__", True)
-    wrapper.__name__ = func.__name__
-    wrapper.__doc__ = func.__doc__
-
     return wrapper
 
 
@@ -75,31 +64,166 @@ class PluginRegistrationError(Exception):
     pass
 
 
-class PluginRegistry:
+class OverrideRequiredMixin:
     """
-    Centralized registry for managing plugin overrides.
+    Mixin for pluggable classes with @override_required methods.
+
+    Creating a subclass that inherits a required method instead of
+    overriding it raises PluginRequiredMethodError immediately.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # The first class in the MRO defining a name provides the attribute;
+        # the class declaring the required method is allowed to define it
+        seen: Set[str] = set()
+        for klass in cls.__mro__[:-1]:
+            for method_name, attr in klass.__dict__.items():
+                if method_name in seen:
+                    continue
+                seen.add(method_name)
+
+                if klass is not cls and getattr(attr, "__override_required__", False):
+                    raise PluginRequiredMethodError(
+                        f"Plugin '{cls.__name__}' must implement the required method '{method_name}'. "
+                        f"This method is marked as @override_required and cannot use the base implementation."
+                    )
+
+
+# Marks attributes that a pluggable class did not define itself
+_MISSING = object()
+
+# _plugin_override value of a pluggable class whose lazy plugin is not imported yet
+_PENDING_LAZY_PLUGIN = object()
+
+
+def _get_original_attr(
+    target_class: type, name: str, original: Any, instance: Any, owner: type
+) -> Any:
+    """
+    Look up an attribute of a pluggable class as if no plugin was installed.
+
+    Used for lookups that don't start at the pluggable class itself, e.g.
+    through super() in a plugin or on other subclasses of the class.
+
+    Args:
+        target_class: The pluggable class holding the installed attribute
+        name: The attribute name
+        original: The attribute the class defined itself, or _MISSING
+        instance: The instance the attribute is accessed on, if any
+        owner: The class the attribute is accessed on
+
+    Returns:
+        The original attribute bound to instance/owner
+    """
+    if original is _MISSING:
+        # Continue the lookup with the classes after the pluggable class
+        return getattr(
+            super(target_class, owner if instance is None else instance), name
+        )
+    if hasattr(original, "__get__"):
+        return original.__get__(instance, owner)
+    return original
+
+
+class _PluginAttr:
+    """
+    A plugin's static/class method installed on its pluggable class.
+
+    Only lookups on the pluggable class itself, like Greet.message_end(),
+    return the plugin implementation. Any other owner, e.g. the plugin
+    calling super() or another subclass of the pluggable class, gets the
+    original attribute.
+    """
+
+    __slots__ = ("_target_class", "_name", "_original", "_bound")
+
+    def __init__(
+        self, target_class: type, name: str, original: Any, plugin_class: type
+    ):
+        self._target_class = target_class
+        self._name = name
+        self._original = original
+        # Resolved once; classmethods are bound to the plugin class
+        self._bound = plugin_class.__dict__[name].__get__(None, plugin_class)
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if owner is self._target_class:
+            return self._bound
+        return _get_original_attr(
+            self._target_class, self._name, self._original, instance, owner
+        )
+
+
+class _LazyPluginAttr:
+    """
+    Placeholder for a static/class method of a pluggable class whose plugin
+    module has not been imported yet.
+
+    The first access on the pluggable class imports the plugin module, which
+    replaces all placeholders, and then returns the real attribute. Other
+    owners get the original attribute without importing anything.
+    """
+
+    __slots__ = ("_target_class", "_name", "_original")
+
+    def __init__(self, target_class: type, name: str, original: Any):
+        self._target_class = target_class
+        self._name = name
+        self._original = original
 
-    This is a singleton class that manages all plugin registrations,
-    lookups, and validations across the application.
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if owner is not self._target_class:
+            return _get_original_attr(
+                self._target_class, self._name, self._original, instance, owner
+            )
+        _REGISTRY.get_plugin_class(self._target_class)
+        return getattr(owner if instance is None else instance, self._name)
+
+
+class _PluginRegistryImpl:
     """
+    Centralized registry for managing plugin overrides.
 
-    _instance: Optional["PluginRegistry"] = None
-    _initialized: bool = False
+    A single instance is created at import time and exported as
+    PluginRegistry; it manages all plugin registrations, lookups, and
+    validations across the application.
+    """
 
-    def __new__(cls) -> "PluginRegistry":
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    __slots__ = (
+        "_plugins",
+        "_pluggable_classes",
+        "_class_metadata",
+        "_lazy_plugins",
+        "_resolve_cache",
+        "_original_attrs",
+        "_plugin_aware_classes",
+        "_module_plugins",
+    )
 
     def __init__(self):
-        if not self._initialized:
-            self._plugins: Dict[str, type] = {}  # {class_name: plugin_class}
-            self._pluggable_classes: Dict[str, type] = {}  # {class_name: base_class}
-            self._class_metadata: Dict[
-                str, Dict[str, Any]
-            ] = {}  # {class_name: metadata}
-            PluginRegistry._initialized = True
-            logger.info("PluginRegistry initialized")
+        self._plugins: Dict[type, type] = {}  # {base_class: plugin_class}
+        # Lazy plugins and entry points refer to pluggable classes by name
+        self._pluggable_classes: Dict[str, type] = {}  # {class_name: base_class}
+        self._class_metadata: Dict[type, Dict[str, Any]] = {}  # {base_class: metadata}
+        self._lazy_plugins: Dict[str, str] = {}  # {class_name: module_path}
+        self._resolve_cache: Dict[type, type] = {}  # {base_class: plugin_class}
+        self._original_attrs: Dict[
+            type, Dict[str, Any]
+        ] = {}  # {base_class: {attr_name: original_attr}}
+        self._plugin_aware_classes: Set[type] = set()
+        # Kept when plugins are cleared: re-importing a module doesn't run @plugin
+        self._module_plugins: Dict[
+            str, Dict[type, type]
+        ] = {}  # {module_path: {base_class: plugin_class}}
+        logger.info("PluginRegistry initialized")
+
+    def __call__(self) -> "_PluginRegistryImpl":
+        """Return the registry itself, so PluginRegistry() keeps working."""
+        return self
 
     def register_pluggable(
         self, cls: type, metadata: Optional[Dict[str, Any]] = None
@@ -116,7 +240,12 @@ class PluginRegistry:
         """
         class_name = cls.__name__
         self._pluggable_classes[class_name] = cls
-        self._class_metadata[class_name] = metadata or {}
+        self._class_metadata[cls] = metadata or {}
+        cls._plugin_override = None  # type: ignore[attr-defined]
+
+        # A country may have registered its lazy plugin before the class existed
+        if class_name in self._lazy_plugins:
+            self._install_lazy_triggers(cls)
 
         logger.info(f"Registered pluggable class: {class_name}")
         return cls
@@ -133,31 +262,242 @@ class PluginRegistry:
             PluginValidationError: If validation fails
             PluginRegistrationError: If registration fails
         """
-        target_name = target_class.__name__
-
         # Validate that target class is pluggable
-        if target_name not in self._pluggable_classes:
+        if target_class not in self._class_metadata:
             raise PluginRegistrationError(
-                f"Target class {target_name} is not registered as pluggable"
+                f"Target class {target_class.__name__} is not registered as pluggable"
             )
 
+        target_name = target_class.__name__
+
         # Validate inheritance
         if not issubclass(plugin_class, target_class):
             raise PluginValidationError(
                 f"Plugin class {plugin_class.__name__} must inherit from {target_name}"
             )
 
+        # Re-registering the same plugin (e.g. a module imported twice) is a no-op
+        if self._plugins.get(target_class) is plugin_class:
+            logger.debug(f"Plugin {plugin_class.__name__} already registered for {target_name}")
+            return
+
         # Register the plugin
-        if target_name in self._plugins:
+        if target_class in self._plugins:
             logger.warning(f"Overriding existing plugin for {target_name}")
 
-        self._plugins[target_name] = plugin_class
+        self._plugins[target_class] = plugin_class
+        self._module_plugins.setdefault(plugin_class.__module__, {})[
+            target_class
+        ] = plugin_class
+        self._ensure_plugin_aware(target_class)
+        target_class._plugin_override = (  # type: ignore[attr-defined]
+            plugin_class if plugin_class is not target_class else None
+        )
+        self._install_plugin_attrs(target_class, plugin_class)
+        self._invalidate()
         logger.info(f"Registered plugin {plugin_class.__name__} for {target_name}")
 
+    def register_lazy_plugin(self, class_name: str, module_path: str) -> None:
+        """
+        Register a module providing the plugin for a pluggable class.
+
+        The module is not imported until the plugin class is first looked up,
+        at which point importing it registers the plugin through @plugin.
+
+        Args:
+            class_name: Name of the pluggable class being overridden
+            module_path: Module that registers the plugin when imported
+        """
+        target_class = self._pluggable_classes.get(class_name)
+
+        # The module was already imported and its plugin is active; re-importing
+        # it would not run @plugin again, so keep the registered class
+        plugin_class = self._plugins.get(target_class)  # type: ignore[arg-type]
+        if plugin_class is not None and plugin_class.__module__ == module_path:
+            logger.debug(f"Plugin module {module_path} already loaded for {class_name}")
+            return
+
+        if self._lazy_plugins.get(class_name) == module_path:
+            return
+
+        if plugin_class is not None or class_name in self._lazy_plugins:
+            logger.warning(f"Overriding existing plugin for {class_name}")
+
+        self._lazy_plugins[class_name] = module_path
+
+        if target_class is not None:
+            self._plugins.pop(target_class, None)
+            self._install_lazy_triggers(target_class)
+
+        self._invalidate()
+        logger.info(f"Registered lazy plugin module {module_path} for {class_name}")
+
+    def register_module_plugins(self, module_path: str) -> int:
+        """
+        Register again the plugins that an imported module registered before.
+
+        Importing a module a second time doesn't run its @plugin decorators,
+        so this restores its plugins e.g. after clear_plugins() or after
+        another country's plugins replaced them.
+
+        Args:
+            module_path: The module whose plugins to register
+
+        Returns:
+            Number of plugins the module provides
+        """
+        module_plugins = self._module_plugins.get(module_path, {})
+        for target_class, plugin_class in list(module_plugins.items()):
+            self.register_plugin(target_class, plugin_class)
+        return len(module_plugins)
+
+    def _ensure_plugin_aware(self, target_class: type) -> None:
+        """
+        Make a pluggable class create plugin instances, once it first gets a plugin.
+
+        Until then the class keeps its own __new__ and is not looked at by
+        the metaclass fallback.
+
+        Args:
+            target_class: The pluggable class receiving a plugin
+        """
+        if target_class not in self._plugin_aware_classes:
+            self._plugin_aware_classes.add(target_class)
+            _make_plugin_aware(target_class)
+
+    def _invalidate(self) -> None:
+        """Drop cached plugin resolutions after a plugin binding changed."""
+        self._resolve_cache.clear()
+
+    def _restore_original_attrs(self, target_class: type) -> None:
+        """
+        Undo the class-level attributes installed on a pluggable class.
+
+        Args:
+            target_class: The pluggable class to restore
+        """
+        originals = self._original_attrs.pop(target_class, {})
+        for attr_name, original in originals.items():
+            if original is _MISSING:
+                delattr(target_class, attr_name)
+            else:
+                setattr(target_class, attr_name, original)
+
+    def _set_class_attr(self, target_class: type, attr_name: str, value: Any) -> None:
+        """
+        Set a class-level attribute on a pluggable class, remembering the original.
+
+        Args:
+            target_class: The pluggable class to modify
+            attr_name: The attribute name
+            value: The attribute value to install
+        """
+        originals = self._original_attrs.setdefault(target_class, {})
+        if attr_name not in originals:
+            originals[attr_name] = target_class.__dict__.get(attr_name, _MISSING)
+        setattr(target_class, attr_name, value)
+
+    def _install_plugin_attrs(self, target_class: type, plugin_class: type) -> None:
+        """
+        Install a plugin's static and class methods on its pluggable class.
+
+        This makes e.g. Greet.message_end() call the plugin implementation
+        through plain attribute lookup, while super() calls in the plugin and
+        other subclasses still see the original implementation.
+
+        Args:
+            target_class: The pluggable class being overridden
+            plugin_class: The plugin implementation
+        """
+        self._restore_original_attrs(target_class)
+
+        for attr_name, attr in plugin_class.__dict__.items():
+            if isinstance(attr, (staticmethod, classmethod)):
+                original = target_class.__dict__.get(attr_name, _MISSING)
+                self._set_class_attr(
+                    target_class,
+                    attr_name,
+                    _PluginAttr(target_class, attr_name, original, plugin_class),
+                )
+
+    def _install_lazy_triggers(self, target_class: type) -> None:
+        """
+        Replace a pluggable class's static and class methods with lazy triggers.
+
+        Accessing any of them imports the pending plugin module first, so
+        class-level calls see the plugin just like instance creation does.
+
+        Args:
+            target_class: The pluggable class with a pending lazy plugin
+        """
+        self._restore_original_attrs(target_class)
+        self._ensure_plugin_aware(target_class)
+        target_class._plugin_override = _PENDING_LAZY_PLUGIN  # type: ignore[attr-defined]
+
+        for attr_name, attr in list(target_class.__dict__.items()):
+            if isinstance(attr, (staticmethod, classmethod)):
+                self._set_class_attr(
+                    target_class,
+                    attr_name,
+                    _LazyPluginAttr(target_class, attr_name, attr),
+                )
+
+    def _import_lazy_plugin(self, class_name: str) -> None:
+        """
+        Import the pending plugin module for a pluggable class.
+
+        Args:
+            class_name: Name of the pluggable class to import the plugin for
+
+        Raises:
+            PluginRegistrationError: If the plugin module cannot be imported
+        """
+        # Pop first so lookups made while the module imports don't recurse
+        module_path = self._lazy_plugins.pop(class_name)
+
+        target_class = self._pluggable_classes.get(class_name)
+        if target_class is not None:
+            self._restore_original_attrs(target_class)
+            target_class._plugin_override = None  # type: ignore[attr-defined]
+        logger.info(f"Importing plugin module {module_path} for {class_name}")
+
+        try:
+            importlib.import_module(module_path)
+        except ImportError as e:
+            raise PluginRegistrationError(
+                f"Failed to import plugin module {module_path} for {class_name}: {e}"
+            ) from e
+
+        # The module may have been imported before, without running @plugin now
+        self.register_module_plugins(module_path)
+
+        if target_class not in self._plugins:
+            logger.warning(f"Module {module_path} did not register a plugin for {class_name}")
+
     def get_plugin_class(self, base_class: type) -> type:
         """
         Get the plugin class for a base class.
 
+        Results are cached per base class; the cache is cleared whenever
+        plugin bindings change.
+
+        Args:
+            base_class: The base class to find a plugin for
+
+        Returns:
+            The plugin class if found, otherwise the base class
+        """
+        try:
+            return self._resolve_cache[base_class]
+        except KeyError:
+            plugin_class = self._lookup_plugin_class(base_class)
+            self._resolve_cache[base_class] = plugin_class
+            return plugin_class
+
+    def _lookup_plugin_class(self, base_class: type) -> type:
+        """
+        Look up the plugin class for a base class, importing a lazy plugin.
+
         Args:
             base_class: The base class to find a plugin for
 
@@ -165,62 +505,138 @@ class PluginRegistry:
             The plugin class if found, otherwise the base class
         """
         class_name = base_class.__name__
-        plugin_class = self._plugins.get(class_name)
+        if class_name in self._lazy_plugins:
+            self._import_lazy_plugin(class_name)
+
+        plugin_class = self._plugins.get(base_class)
 
         if plugin_class:
-            logger.debug(f"Using plugin {plugin_class.__name__} for {class_name}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Using plugin %s for %s", plugin_class.__name__, class_name)
             return plugin_class
         else:
-            logger.debug(f"No plugin found for {class_name}, using base class")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No plugin found for %s, using base class", class_name)
             return base_class
 
     def get_pluggable_classes(self) -> list[str]:
         """Get list of all pluggable class names."""
         return list(self._pluggable_classes.keys())
 
+    def freeze(self) -> None:
+        """
+        Import all pending lazy plugins of the registered pluggable classes.
+
+        Afterwards every plugin static and class method, e.g. Name.get used by
+        Greet.say_hello2, is a plain attribute of its pluggable class, so no
+        call goes through a lazy trigger. Plugins registered later still take
+        effect, because they are installed on the class as well.
+
+        Plugin modules may define further pluggable classes or register more
+        lazy plugins, so this repeats until nothing is pending.
+        """
+        while True:
+            pending = [
+                class_name
+                for class_name in self._pluggable_classes
+                if class_name in self._lazy_plugins
+            ]
+            if not pending:
+                break
+            for class_name in pending:
+                # An earlier import may have resolved or replaced it already
+                if class_name in self._lazy_plugins:
+                    self._import_lazy_plugin(class_name)
+        self._invalidate()
+
+    def clear_plugins(self) -> None:
+        """Unregister all plugins, keeping the pluggable classes (for testing)."""
+        for target_class in self._pluggable_classes.values():
+            self._restore_original_attrs(target_class)
+            target_class._plugin_override = None  # type: ignore[attr-defined]
+
+        self._plugins.clear()
+        self._lazy_plugins.clear()
+        self._invalidate()
+
+
+_REGISTRY = _PluginRegistryImpl()
+
+# The registry is used as an object, e.g. PluginRegistry.get_pluggable_classes()
+PluginRegistry = _REGISTRY
+
 
 T = TypeVar("T", bound=type)
 
 
 class PluggableMeta(type):
     """
-    Metaclass for pluggable classes that intercepts class-level attribute access
-    to redirect static/class methods to plugin implementations.
+    Metaclass for pluggable classes.
+
+    Plugin static and class methods are installed on the pluggable class
+    when the plugin is registered, so normal attribute lookup finds them.
+    __getattr__ only runs when that lookup fails; it imports a pending lazy
+    plugin so attributes that the plugin adds on top of its base class are
+    found on first access.
     """
-    
-    def __getattribute__(cls, name: str) -> Any:
-        # Skip special attributes and internal attributes to avoid recursion
-        if (name.startswith('__') or name.startswith('_') or 
-            name in ('mro', 'register', '__dict__', '__class__')):
-            return super(PluggableMeta, cls).__getattribute__(name)
-        
-        # Only check for plugins if this is marked as pluggable
-        # Use super() to avoid recursion when checking _is_pluggable
-        try:
-            is_pluggable = super(PluggableMeta, cls).__getattribute__('_is_pluggable')
-        except AttributeError:
-            is_pluggable = False
-            
-        if is_pluggable:
-            # Get the registry
-            registry = PluginRegistry()
-            plugin_class = registry.get_plugin_class(cls)
-            
-            # If we have a plugin different from the base class
-            # Compare by name since the classes might be different types
-            if plugin_class.__name__ != cls.__name__ or plugin_class.__module__ != cls.__module__:
-                # Check if the plugin has this attribute in its own __dict__ (not inherited)
-                if name in plugin_class.__dict__:
-                    plugin_attr = plugin_class.__dict__[name]
-                    
-                    # If it's a classmethod or staticmethod, use the descriptor protocol to get the bound version
-                    if isinstance(plugin_attr, classmethod):
-                        return plugin_attr.__get__(None, plugin_class)  # type: ignore[return-value]
-                    elif isinstance(plugin_attr, staticmethod):
-                        return plugin_attr.__get__(None, plugin_class)  # type: ignore[return-value]
-        
-        # For everything else, return the base attribute
-        return super(PluggableMeta, cls).__getattribute__(name)
+
+    # ids of the classes decorated with @pluggable
+    _pluggable_classes: ClassVar[Set[int]] = set()
+
+    def __getattr__(cls, name: str) -> Any:
+        # Internal and special attributes are never redirected
+        if name[:1] != "_" and id(cls) in PluggableMeta._pluggable_classes:
+            # A registered plugin's static and class methods are already installed
+            # on the class; only a pending lazy plugin can still add some
+            if cls._plugin_override is _PENDING_LAZY_PLUGIN:
+                _REGISTRY.get_plugin_class(cls)
+                if name in cls.__dict__:
+                    return type.__getattribute__(cls, name)
+
+        raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+
+
+def _make_plugin_aware(target_class: type) -> None:
+    """
+    Wrap the __new__ method of a pluggable class to create plugin instances.
+
+    Args:
+        target_class: The pluggable class to modify in place
+    """
+    # Let the metaclass fallback handle the class
+    PluggableMeta._pluggable_classes.add(id(target_class))
+    weakref.finalize(
+        target_class, PluggableMeta._pluggable_classes.discard, id(target_class)
+    )
+
+    # Store original __new__ method
+    original_new = target_class.__new__
+
+    def plugin_aware_new(cls: type, *args: Any, **kwargs: Any) -> Any:
+        # Kept up to date by the registry, so the common case needs no lookup;
+        # other subclasses of the pluggable class are instantiated as they are
+        plugin_class = (
+            target_class._plugin_override  # type: ignore[attr-defined]
+            if cls is target_class
+            else None
+        )
+        if plugin_class is _PENDING_LAZY_PLUGIN:
+            plugin_class = _REGISTRY.get_plugin_class(target_class)
+
+        if plugin_class is not None and plugin_class is not target_class:
+            # Create instance of plugin class directly
+            # Use object.__new__ to avoid recursion
+            instance = object.__new__(plugin_class)  # type: ignore[misc]
+            return instance  # type: ignore[return-value]
+        else:
+            # Create instance of base class normally
+            if original_new is object.__new__:
+                instance = object.__new__(cls)  # type: ignore[misc]
+            else:
+                instance = original_new(cls, *args, **kwargs)  # type: ignore[misc]
+            return instance  # type: ignore[return-value]
+
+    target_class.__new__ = staticmethod(plugin_aware_new)  # type: ignore[method-assign]
 
 
 def pluggable(cls: T, *, metadata: Optional[Dict[str, Any]] = None) -> T:
@@ -228,9 +644,14 @@ def pluggable(cls: T, *, metadata: Optional[Dict[str, Any]] = None) -> T:
     Decorator to mark a class as pluggable.
 
     This decorator registers a class with the plugin registry as eligible
-    for plugin overrides. The class __new__ method is modified to return
-    plugin instances when available, and the metaclass handles static/class
-    method redirection to plugins.
+    for plugin overrides. Nothing else about the class changes until a
+    plugin (or a lazy plugin module) is registered for it: then its
+    __new__ method is modified to return plugin instances, and the registry
+    installs plugin static/class methods on the class.
+
+    The class is modified in place rather than rebuilt. Declare it with
+    metaclass=PluggableMeta to also get the fallback for attributes that
+    only exist on a lazily loaded plugin.
 
     Args:
         cls: The class to mark as pluggable
@@ -239,50 +660,7 @@ def pluggable(cls: T, *, metadata: Optional[Dict[str, Any]] = None) -> T:
     Returns:
         The decorated class with plugin support
     """
-
-    def decorator(target_class: T) -> T:
-        registry = PluginRegistry()
-        registry.register_pluggable(target_class, metadata)
-
-        # Create a new class with the PluggableMeta metaclass
-        new_class = PluggableMeta(
-            target_class.__name__,
-            target_class.__bases__,
-            dict(target_class.__dict__)
-        )
-        
-        # Mark it as pluggable for the metaclass
-        new_class._is_pluggable = True  # type: ignore[attr-defined]
-        
-        # Copy over the original class attributes
-        for attr_name, attr_value in target_class.__dict__.items():
-            if not attr_name.startswith('__') or attr_name in ('__module__', '__qualname__', '__doc__'):
-                setattr(new_class, attr_name, attr_value)
-
-        # Store original __new__ method
-        original_new = target_class.__new__
-
-        def plugin_aware_new(cls: type, *args: Any, **kwargs: Any) -> Any:
-            # Get the appropriate plugin class
-            plugin_class = registry.get_plugin_class(target_class)
-
-            if plugin_class != target_class:
-                # Create instance of plugin class directly
-                # Use object.__new__ to avoid recursion
-                instance = object.__new__(plugin_class)  # type: ignore[misc]
-                return instance  # type: ignore[return-value]
-            else:
-                # Create instance of base class normally
-                if original_new is object.__new__:
-                    instance = object.__new__(cls)  # type: ignore[misc]
-                else:
-                    instance = original_new(cls, *args, **kwargs)  # type: ignore[misc]
-                return instance  # type: ignore[return-value]
-
-        new_class.__new__ = staticmethod(plugin_aware_new)  # type: ignore[method-assign]
-        return new_class  # type: ignore[return-value]
-
-    return decorator(cls)
+    return _REGISTRY.register_pluggable(cls, metadata)  # type: ignore[return-value]
 
 
 def plugin(target_class: Any) -> Callable[[type], type]:
@@ -297,9 +675,7 @@ def plugin(target_class: Any) -> Callable[[type], type]:
     """
 
     def decorator(plugin_class: type) -> type:
-        registry = PluginRegistry()
-        # Register the plugin
-        registry.register_plugin(target_class, plugin_class)
+        _REGISTRY.register_plugin(target_class, plugin_class)
         return plugin_class
 
     return decorator
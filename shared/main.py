@@ -27,7 +27,7 @@ class DefaultGreet(Greet):
 
     def get_greeting_info(self) -> dict[str, str]:
         """Override to indicate this is the default implementation."""
-        info = super().get_greeting_info()
+        info = dict(super().get_greeting_info())
         info["type"] = "default"
         return info
 
@@ -36,8 +36,7 @@ def main():
     """Main function for standalone shared module."""
     logger.info("Starting shared module in standalone mode")
 
-    registry = PluginRegistry()
-    logger.info(f"Pluggable classes: {registry.get_pluggable_classes()}")
+    logger.info(f"Pluggable classes: {PluginRegistry.get_pluggable_classes()}")
 
     # For standalone mode, we need to manually create the default implementation
     # since no plugins are loaded
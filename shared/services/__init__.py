@@ -1,5 +1,5 @@
 """Services module initialization."""
 
-from .greeting import Greet
+from .greeting import Greet, make_greet
 
-__all__ = ["Greet"]
+__all__ = ["Greet", "make_greet"]
@@ -1,19 +1,61 @@
-from shared.core.registry import pluggable
+import operator
+import re
+
+from shared.core.registry import PluggableMeta, pluggable
+
+_HAS_NON_WS = re.compile(r"\S").search
+
+
+def _format_field(slot: str) -> property:
+    """
+    Create a property for an attribute that feeds into the formatted address.
+
+    Reads go straight to the slot; writes also drop the cached formatted
+    address.
+
+    Args:
+        slot: Name of the slot holding the value
+
+    Returns:
+        The property for the attribute
+    """
+
+    def fset(self: "Address", value: str) -> None:
+        setattr(self, slot, value)
+        self._formatted = None
+
+    return property(operator.attrgetter(slot), fset)
 
 
 @pluggable
-class Address:
+class Address(metaclass=PluggableMeta):
     """
     Base address class that can be overridden by country-specific plugins.
     """
 
+    __slots__ = (
+        "default_country",
+        "_separator",
+        "_street",
+        "_city",
+        "_postal_code",
+        "_formatted",
+    )
+
+    separator = _format_field("_separator")
+    street = _format_field("_street")
+    city = _format_field("_city")
+    postal_code = _format_field("_postal_code")
+
     def __init__(self, street: str, city: str, postal_code: str):
         """Initialize the address service."""
+        # Set the slots directly; there is no cached address to drop yet
+        self._formatted: str | None = None
         self.default_country = "US"
-        self.separator = ", "
-        self.street = street
-        self.city = city
-        self.postal_code = postal_code
+        self._separator = ", "
+        self._street = street
+        self._city = city
+        self._postal_code = postal_code
 
     def format_address(self) -> str:
         """
@@ -27,9 +69,14 @@ class Address:
         Returns:
             Formatted address string
         """
-        if not self._validate_postal_code(self.postal_code):
-            raise ValueError(f"Invalid postal code: {self.postal_code}")
-        return f"{self.street}{self.separator}{self.city}{self.separator}{self.postal_code}"
+        formatted = self._formatted
+        if formatted is None:
+            postal_code = self._postal_code
+            if not self._validate_postal_code(postal_code):
+                raise ValueError(f"Invalid postal code: {postal_code}")
+            formatted = self._separator.join((self._street, self._city, postal_code))
+            self._formatted = formatted
+        return formatted
 
     def get_country(self) -> str:
         """
@@ -63,4 +110,4 @@ class Address:
         Returns:
             True if valid, False otherwise
         """
-        return len(postal_code.strip()) > 0
+        return postal_code is not None and _HAS_NON_WS(postal_code) is not None
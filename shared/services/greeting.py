@@ -2,18 +2,26 @@
 Example greeting service for demonstration of the plugin system.
 """
 
-from typing import Any
+import types
+from typing import Any, Mapping
 
-from shared.core.registry import pluggable, override_required
+from shared.core.registry import (
+    OverrideRequiredMixin,
+    PluggableMeta,
+    override_required,
+    pluggable,
+)
 from shared.services.name import Name
 
 
 @pluggable
-class Greet:
+class Greet(OverrideRequiredMixin, metaclass=PluggableMeta):
     """
     Base greeting class that can be overridden by country-specific plugins.
     """
 
+    __slots__ = ()
+
     @override_required
     def say_hello(self, name: str) -> str:
         """
@@ -25,8 +33,9 @@ class Greet:
         Returns:
             A greeting message
         """
-        # This should never be called as plugins must override this method
-        return f"Hello, {name}{self.message_end()}"  # Default implementation that will trigger error if not overridden
+        # Never runs: @override_required raises for the base implementation and
+        # subclasses that don't override it are rejected
+        return f"Hello, {name}{self.message_end()}"
 
     def say_hello2(self) -> str:
         return f"Hello {Name.get()}{self.message_end()}"
@@ -50,15 +59,91 @@ class Greet:
         """
         return f"Goodbye, {name}{self.message_end()}"
 
-    def get_greeting_info(self) -> dict[str, Any]:
+    def get_greeting_info(self) -> Mapping[str, Any]:
         """
         Get information about this greeting implementation.
 
         Returns:
-            Dictionary with implementation details
+            Mapping with implementation details; plugins may return a
+            shared read-only mapping
         """
         return {
             "class": self.__class__.__name__,
             "module": self.__class__.__module__,
             "type": "base",
         }
+
+
+def _template_message_end(cls: type) -> str:
+    """Get the message end of a generated greeting class."""
+    return cls._END  # type: ignore[attr-defined]
+
+
+def _template_say_hello(self: Greet, name: str) -> str:
+    """Say hello using the class hello template."""
+    return self._HELLO_TMPL % (name, self._END)  # type: ignore[attr-defined]
+
+
+def _template_say_goodbye(self: Greet, name: str) -> str:
+    """Say goodbye using the class goodbye template."""
+    return self._GOODBYE_TMPL % (name, self._END)  # type: ignore[attr-defined]
+
+
+def _template_get_greeting_info(self: Greet) -> Mapping[str, Any]:
+    """Get the read-only information about this generated implementation."""
+    return self._INFO  # type: ignore[attr-defined]
+
+
+def make_greet(
+    class_name: str,
+    module: str,
+    country: str,
+    language: str,
+    hello_tmpl: str,
+    goodbye_tmpl: str,
+    end: str = "!",
+) -> type:
+    """
+    Create a country-specific Greet subclass from greeting templates.
+
+    Every generated class shares the same method implementations and only
+    differs in its class-level constants.
+
+    Args:
+        class_name: Name of the generated class
+        module: Module the class belongs to (usually the caller's __name__)
+        country: Country code of the implementation
+        language: Language of the greetings
+        hello_tmpl: %-template formatted with the name and the message end
+        goodbye_tmpl: %-template formatted with the name and the message end
+        end: The message end of the implementation
+
+    Returns:
+        The generated Greet subclass, to be registered with @plugin
+    """
+    namespace = {
+        "__module__": module,
+        "__qualname__": class_name,
+        "__doc__": f"{language}-specific greeting implementation.",
+        # Keep instances without a __dict__, like the Greet base
+        "__slots__": (),
+        "_INFO": types.MappingProxyType(
+            {
+                "class": class_name,
+                "module": module,
+                "type": f"{language.lower()}_plugin",
+                "country": country,
+                "language": language,
+            }
+        ),
+        "_HELLO_TMPL": hello_tmpl,
+        "_GOODBYE_TMPL": goodbye_tmpl,
+        "_END": end,
+        # Defined on the generated class itself so that the metaclass
+        # redirects Greet.message_end() to it
+        "message_end": classmethod(_template_message_end),
+        "say_hello": _template_say_hello,
+        "say_goodbye": _template_say_goodbye,
+        "get_greeting_info": _template_get_greeting_info,
+    }
+    return type(Greet)(class_name, (Greet,), namespace)
@@ -1,8 +1,10 @@
-from shared.core.registry import pluggable
+from shared.core.registry import PluggableMeta, pluggable
 
 
 @pluggable
-class Name:
+class Name(metaclass=PluggableMeta):
+    __slots__ = ()
+
     @staticmethod
     def get() -> str:
         """
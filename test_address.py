@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tests for the base address service.
+"""
+
+import sys
+
+import pytest
+
+from shared.services.address import Address
+
+
+@pytest.mark.parametrize(
+    "field, value, expected",
+    [
+        ("street", "1 Side Street", "1 Side Street, Budapest, 12345"),
+        ("city", "Vienna", "123 Main Street, Vienna, 12345"),
+        ("postal_code", "54321", "123 Main Street, Budapest, 54321"),
+        ("separator", " | ", "123 Main Street | Budapest | 12345"),
+    ],
+)
+def test_format_address_follows_field_changes(field, value, expected):
+    """Test that changing a field after formatting updates the formatted address."""
+    address = Address("123 Main Street", "Budapest", "12345")
+    assert address.format_address() == "123 Main Street, Budapest, 12345"
+
+    setattr(address, field, value)
+
+    assert getattr(address, field) == value
+    assert address.format_address() == expected
+
+
+def test_format_address_rejects_invalid_postal_code_after_change():
+    """Test that a postal code changed after formatting is validated again."""
+    address = Address("123 Main Street", "Budapest", "12345")
+    address.format_address()
+
+    address.postal_code = "   "
+
+    with pytest.raises(ValueError, match="Invalid postal code"):
+        address.format_address()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
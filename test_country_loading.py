@@ -1,213 +1,215 @@
 #!/usr/bin/env python3
 """
-Test script to demonstrate country-specific plugin loading.
+Tests demonstrating country-specific plugin loading.
+
+The tests run main.main() in-process, resetting the plugin state between
+tests so each one starts like a fresh program invocation.
 """
 
-import os
-import subprocess
+import logging
 import sys
 
+import pytest
+
+import main
+from shared.core import country_loader
+from shared.core.country_loader import (
+    get_country_from_config,
+    get_loader,
+    reset_country_config_cache,
+)
+from shared.core.registry import PluginRegistry
+from shared.services.greeting import Greet
+from shared.services.name import Name
+
+
+@pytest.fixture(autouse=True)
+def fresh_plugin_state(monkeypatch, tmp_path):
+    """Reset plugins, loaded countries and configuration around each test."""
+    # Keep a country_config.txt in the working directory out of the tests
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("PLUGIN2_COUNTRY", raising=False)
+    root_handlers = logging.root.handlers[:]
+    root_level = logging.root.level
+
+    yield
+
+    logging.root.handlers[:] = root_handlers
+    logging.root.setLevel(root_level)
+    PluginRegistry.clear_plugins()
+    get_loader().clear_loaded_countries()
+    reset_country_config_cache()
+
+    # Re-importing a plugin module must register its plugin again
+    for module_name in list(sys.modules):
+        if module_name.startswith("country_specific."):
+            del sys.modules[module_name]
+
+
+def run_main(monkeypatch, *args: str) -> None:
+    """Run the application as if started with the given arguments."""
+    monkeypatch.setattr(sys, "argv", ["main.py", *args])
+    main.main()
 
-def run_test(test_name: str, country_code: str, expected_greeting: str):
-    """Run a test case for a specific country."""
-    print(f"\n{'=' * 60}")
-    print(f"TEST: {test_name}")
-    print(f"Country: {country_code}")
-    print(f"Expected greeting pattern: {expected_greeting}")
-    print("=" * 60)
 
-    # Run the main script with the country code
-    try:
-        result = subprocess.run(
-            [sys.executable, "main.py", country_code],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+@pytest.mark.parametrize(
+    "country_code, expected_greeting",
+    [("cz", "Ahoj"), ("hu", "Szia")],
+)
+def test_country_plugin(monkeypatch, capsys, country_code, expected_greeting):
+    """Test loading the plugins of a country given on the command line."""
+    run_main(monkeypatch, country_code)
 
-        print("STDOUT:")
-        print(result.stdout)
+    assert expected_greeting.lower() in capsys.readouterr().out.lower()
 
-        if result.stderr:
-            print("STDERR:")
-            print(result.stderr)
 
-        print(f"Return code: {result.returncode}")
+def test_output_ignores_root_log_level(monkeypatch, capsys):
+    """Test that raising the root log level only silences diagnostics."""
+    setup_logging = main.setup_logging
 
-        # Check if expected greeting is in output
-        if expected_greeting.lower() in result.stdout.lower():
-            print(f"✅ SUCCESS: Found expected greeting pattern '{expected_greeting}'")
-        else:
-            print(
-                f"❌ FAILURE: Expected greeting pattern '{expected_greeting}' not found"
-            )
+    def setup_quiet_logging():
+        setup_logging()
+        logging.getLogger().setLevel(logging.WARNING)
 
-        return result.returncode == 0
+    monkeypatch.setattr(main, "setup_logging", setup_quiet_logging)
 
-    except subprocess.TimeoutExpired:
-        print("❌ FAILURE: Test timed out")
-        return False
-    except Exception as e:
-        print(f"❌ FAILURE: {e}")
-        return False
+    run_main(monkeypatch, "cz")
 
+    captured = capsys.readouterr()
+    assert "Hello: Ahoj" in captured.out
+    assert "INFO" not in captured.err
 
-def test_environment_variable():
+
+def test_invalid_country(monkeypatch):
+    """Test that an invalid country code is rejected."""
+    with pytest.raises(SystemExit) as exc_info:
+        run_main(monkeypatch, "invalid")
+
+    assert exc_info.value.code != 0
+
+
+def test_environment_variable(monkeypatch, capsys):
     """Test loading country from environment variable."""
-    print(f"\n{'=' * 60}")
-    print("TEST: Environment Variable Country Selection")
-    print("=" * 60)
-
-    # Set environment variable
-    env = os.environ.copy()
-    env["PLUGIN2_COUNTRY"] = "hu"
-
-    try:
-        result = subprocess.run(
-            [sys.executable, "main.py"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            env=env,
-        )
-
-        print("STDOUT:")
-        print(result.stdout)
-
-        if result.stderr:
-            print("STDERR:")
-            print(result.stderr)
-
-        print(f"Return code: {result.returncode}")
-
-        # Check if Hungarian greeting is used
-        if "szia" in result.stdout.lower():
-            print("✅ SUCCESS: Hungarian greeting loaded from environment variable")
-            return True
-        else:
-            print("❌ FAILURE: Expected Hungarian greeting not found")
-            return False
-
-    except Exception as e:
-        print(f"❌ FAILURE: {e}")
-        return False
-
-
-def test_config_file():
+    monkeypatch.setenv("PLUGIN2_COUNTRY", "hu")
+
+    run_main(monkeypatch)
+
+    assert "szia" in capsys.readouterr().out.lower()
+
+
+def test_config_file(monkeypatch, capsys, tmp_path):
     """Test loading country from config file."""
-    print(f"\n{'=' * 60}")
-    print("TEST: Config File Country Selection")
-    print("=" * 60)
-
-    # Create temporary config file
-    config_file = "country_config.txt"
-    try:
-        with open(config_file, "w") as f:
-            f.write("cz")
-
-        result = subprocess.run(
-            [sys.executable, "main.py"], capture_output=True, text=True, timeout=30
-        )
-
-        print("STDOUT:")
-        print(result.stdout)
-
-        if result.stderr:
-            print("STDERR:")
-            print(result.stderr)
-
-        print(f"Return code: {result.returncode}")
-
-        # Check if Czech greeting is used
-        if "ahoj" in result.stdout.lower():
-            print("✅ SUCCESS: Czech greeting loaded from config file")
-            return True
-        else:
-            print("❌ FAILURE: Expected Czech greeting not found")
-            return False
-
-    except Exception as e:
-        print(f"❌ FAILURE: {e}")
-        return False
-    finally:
-        # Clean up config file
-        if os.path.exists(config_file):
-            os.remove(config_file)
-
-
-def main():
-    """Run all tests."""
-    print("Starting Plugin2 Country-Specific Loading Tests")
-    print(f"Python: {sys.executable}")
-    print(f"Working directory: {os.getcwd()}")
-
-    tests_passed = 0
-    total_tests = 0
-
-    # Test 1: Czech Republic
-    total_tests += 1
-    if run_test("Czech Republic Plugin", "cz", "Ahoj"):
-        tests_passed += 1
-
-    # Test 2: Hungary
-    total_tests += 1
-    if run_test("Hungary Plugin", "hu", "Szia"):
-        tests_passed += 1
-
-    # Test 3: Invalid country
-    total_tests += 1
-    print(f"\n{'=' * 60}")
-    print("TEST: Invalid Country Code")
-    print("=" * 60)
-    try:
-        result = subprocess.run(
-            [sys.executable, "main.py", "invalid"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-
-        print("STDOUT:")
-        print(result.stdout)
-
-        if result.stderr:
-            print("STDERR:")
-            print(result.stderr)
-
-        print(f"Return code: {result.returncode}")
-
-        if result.returncode != 0:
-            print("✅ SUCCESS: Invalid country code properly rejected")
-            tests_passed += 1
-        else:
-            print("❌ FAILURE: Invalid country code should have failed")
-
-    except Exception as e:
-        print(f"❌ FAILURE: {e}")
-
-    # Test 4: Environment variable
-    total_tests += 1
-    if test_environment_variable():
-        tests_passed += 1
-
-    # Test 5: Config file
-    total_tests += 1
-    if test_config_file():
-        tests_passed += 1
-
-    # Summary
-    print(f"\n{'=' * 60}")
-    print("TEST SUMMARY")
-    print("=" * 60)
-    print(f"Tests passed: {tests_passed}/{total_tests}")
-
-    if tests_passed == total_tests:
-        print("🎉 All tests passed!")
-        return 0
-    else:
-        print("❌ Some tests failed!")
-        return 1
+    (tmp_path / "country_config.txt").write_text("cz")
+
+    run_main(monkeypatch)
+
+    assert "ahoj" in capsys.readouterr().out.lower()
+
+
+@pytest.mark.parametrize("lazy", [True, False], ids=["lazy", "eager"])
+def test_reload_after_clearing_plugins(monkeypatch, lazy):
+    """Test reloading a country after clearing plugins, keeping its modules imported."""
+    if not lazy:
+        # Without per-service entry points the whole package is imported
+        monkeypatch.setattr(country_loader, "_discover_services", lambda code: {})
+    loader = get_loader()
+
+    assert loader.load_country_plugins("cz")
+    assert Greet().say_hello("World").startswith("Ahoj")
+
+    PluginRegistry.clear_plugins()
+    loader.clear_loaded_countries()
+    assert "country_specific.cz.greeting" in sys.modules
+
+    assert loader.load_country_plugins("cz")
+    assert Greet().say_hello("World").startswith("Ahoj")
+    assert loader.get_loaded_countries() == ("cz",)
+
+
+def test_unresolvable_plugin_module_fails_country_load(monkeypatch):
+    """Test that a plugin entry point pointing to a missing module is rejected."""
+    monkeypatch.setattr(
+        country_loader,
+        "_discover_services",
+        lambda code: {
+            "Name": "country_specific.cz.name",
+            "Greet": "country_specific.cz.no_such_module",
+        },
+    )
+    loader = get_loader()
+
+    assert not loader.load_country_plugins("cz")
+    assert loader.get_loaded_countries() == ()
+    assert Name.get() == "Default Name"
+
+
+def test_switch_countries_in_process():
+    """Test loading a country again after another one replaced its plugins."""
+    loader = get_loader()
+    for country_code, greeting in [("cz", "Ahoj"), ("hu", "Szia"), ("cz", "Ahoj")]:
+        loader.clear_loaded_countries()
+        assert loader.load_country_plugins(country_code)
+        assert Greet().say_hello("World").startswith(greeting)
+
+
+def test_config_read_is_retried_until_found(tmp_path):
+    """Test that a missing configuration is not cached, but a found one is."""
+    assert get_country_from_config() is None
+
+    config_file = tmp_path / "country_config.txt"
+    config_file.write_text("hu")
+    assert get_country_from_config() == "hu"
+
+    config_file.write_text("cz")
+    assert get_country_from_config() == "hu"
+
+
+def test_freeze_imports_lazy_plugins(monkeypatch, tmp_path):
+    """Test that freezing the registry imports the pending plugin modules."""
+    # A plugin module that defines another pluggable class while being
+    # imported, which has its own lazy plugin waiting
+    (tmp_path / "freeze_name_plugin.py").write_text(
+        "from shared.core.registry import pluggable, plugin\n"
+        "from shared.services.name import Name\n"
+        "\n"
+        "@pluggable\n"
+        "class FreezeTarget:\n"
+        "    @staticmethod\n"
+        "    def get():\n"
+        "        return 'base'\n"
+        "\n"
+        "@plugin(Name)\n"
+        "class FreezeName(Name):\n"
+        "    @staticmethod\n"
+        "    def get():\n"
+        "        return 'Freeze Name'\n"
+    )
+    (tmp_path / "freeze_target_plugin.py").write_text(
+        "from freeze_name_plugin import FreezeTarget\n"
+        "from shared.core.registry import plugin\n"
+        "\n"
+        "@plugin(FreezeTarget)\n"
+        "class FrozenTarget(FreezeTarget):\n"
+        "    @staticmethod\n"
+        "    def get():\n"
+        "        return 'plugin'\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for module_name in ("freeze_name_plugin", "freeze_target_plugin"):
+        monkeypatch.delitem(sys.modules, module_name, raising=False)
+
+    assert get_loader().load_country_plugins("cz")
+    assert "country_specific.cz.greeting" not in sys.modules
+    PluginRegistry.register_lazy_plugin("Name", "freeze_name_plugin")
+    PluginRegistry.register_lazy_plugin("FreezeTarget", "freeze_target_plugin")
+
+    PluginRegistry.freeze()
+
+    assert "country_specific.cz.greeting" in sys.modules
+    assert "freeze_target_plugin" in sys.modules
+    assert Name.get() == "Freeze Name"
+    assert sys.modules["freeze_name_plugin"].FreezeTarget.get() == "plugin"
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(pytest.main([__file__]))
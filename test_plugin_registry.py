@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for plugin registration on pluggable classes.
+"""
+
+import sys
+
+import pytest
+
+from shared.core.registry import PluginRegistry, PluginRequiredMethodError, plugin
+from shared.services.greeting import Greet, make_greet
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    """Unregister the plugins registered by a test."""
+    yield
+    PluginRegistry.clear_plugins()
+
+
+class _TestGreet(Greet):
+    """Greeting plugin used by the tests."""
+
+    def say_hello(self, name: str) -> str:
+        return f"Hi, {name}{self.message_end()}"
+
+
+def test_plugin_classmethod_can_call_super():
+    """Test that super() in a plugin classmethod reaches the base implementation."""
+
+    @plugin(Greet)
+    class QuestionGreet(_TestGreet):
+        @classmethod
+        def message_end(cls) -> str:
+            return super().message_end() + "?"
+
+    assert QuestionGreet.message_end() == "!?"
+    assert Greet.message_end() == "!?"
+    assert Greet().say_hello("World") == "Hi, World!?"
+
+
+def test_plugin_attrs_do_not_leak_to_other_subclasses():
+    """Test that other subclasses of a pluggable class keep their own behaviour."""
+
+    class Other(_TestGreet):
+        pass
+
+    class OwnEnd(_TestGreet):
+        @classmethod
+        def message_end(cls) -> str:
+            return "."
+
+    @plugin(Greet)
+    class LoudGreet(_TestGreet):
+        @classmethod
+        def message_end(cls) -> str:
+            return "PPP"
+
+    assert Greet.message_end() == "PPP"
+    assert Other.message_end() == "!"
+    assert Other().say_hello("World") == "Hi, World!"
+    assert OwnEnd.message_end() == "."
+
+
+def test_subclass_must_override_required_method():
+    """Test that a subclass without a required method is rejected when created."""
+    with pytest.raises(PluginRequiredMethodError, match="say_hello"):
+
+        class IncompleteGreet(Greet):
+            pass
+
+
+def test_required_method_raises_without_plugin():
+    """Test that calling a required method on the un-plugged base raises."""
+    with pytest.raises(PluginRequiredMethodError, match="say_hello"):
+        Greet().say_hello("World")
+
+
+def test_generated_greeting_info_is_read_only():
+    """Test that the shared greeting info of a generated class can't be changed."""
+    TemplateGreet = plugin(Greet)(
+        make_greet(
+            "TemplateGreet",
+            __name__,
+            country="xx",
+            language="Test",
+            hello_tmpl="Hi, %s%s",
+            goodbye_tmpl="Bye, %s%s",
+        )
+    )
+
+    info = Greet().get_greeting_info()
+
+    assert info["country"] == "xx"
+    assert Greet().get_greeting_info() is info
+    with pytest.raises(TypeError):
+        info["country"] = "changed"  # type: ignore[index]
+
+
+def test_generated_greeting_has_no_instance_dict():
+    """Test that generated greeting classes keep the slots of the Greet base."""
+    TemplateGreet = plugin(Greet)(
+        make_greet(
+            "TemplateGreet",
+            __name__,
+            country="xx",
+            language="Test",
+            hello_tmpl="Hi, %s%s",
+            goodbye_tmpl="Bye, %s%s",
+        )
+    )
+
+    assert not hasattr(TemplateGreet(), "__dict__")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))